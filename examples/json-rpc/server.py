@@ -1,5 +1,6 @@
+import argparse
+import asyncio
 import dataclasses
-import json
 import logging
 from typing import Callable
 
@@ -8,12 +9,13 @@ from werkzeug.serving import run_simple
 
 from rolo import Response
 from rolo.gateway import Gateway, HandlerChain, RequestContext
+from rolo.gateway.asgi import AsgiGateway
 from rolo.gateway.wsgi import WsgiGateway
 
 LOG = logging.getLogger(__name__)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RpcRequest:
     jsonrpc: str
     method: str
@@ -21,6 +23,20 @@ class RpcRequest:
     params: dict | list | None = None
 
 
+class RpcContext(RequestContext):
+    """
+    Request context that declares the attributes used by the handlers as slots, which makes storing and accessing
+    them faster than the per-instance dict.
+    """
+
+    __slots__ = ("rpc_request_id", "rpc_request", "method", "result")
+
+    rpc_request_id: str | int | None
+    rpc_request: RpcRequest
+    method: Callable
+    result: object
+
+
 class RpcError(Exception):
     code: int
     message: str
@@ -62,7 +78,8 @@ def parse_request(chain: HandlerChain, context: RequestContext, response: Respon
             doc["id"],
             doc.get("params"),
         )
-    except KeyError as e:
+    except (KeyError, TypeError) as e:
+        # the document is either missing keys, or is not a JSON object at all
         raise ParseError() from e
 
 
@@ -143,13 +160,40 @@ def serialize_result(chain: HandlerChain, context: RequestContext, response: Res
     response.set_json(
         {
             "jsonrpc": "2.0",
-            "result": json.dumps(context.result),
+            "result": context.result,
             "id": context.rpc_request_id,
         }
     )
 
 
+def serve_asgi(gateway: Gateway, host: str, port: int):
+    """
+    Serves the gateway as ASGI app through hypercorn (``pip install hypercorn``), where the asyncio event loop
+    handles the connections, and requests are processed by the gateway in a thread pool.
+    """
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    config = Config()
+    config.bind = [f"{host}:{port}"]
+
+    async def _serve():
+        app = AsgiGateway(gateway, event_loop=asyncio.get_running_loop())
+        try:
+            await serve(app, config)
+        finally:
+            app.close()
+
+    asyncio.run(_serve())
+
+
 def main():
+    parser = argparse.ArgumentParser(description="A simple JSON-RPC server built with rolo")
+    parser.add_argument(
+        "--asgi", action="store_true", help="serve through hypercorn instead of werkzeug"
+    )
+    args = parser.parse_args()
+
     logging.basicConfig(level=logging.DEBUG)
 
     def subtract(subtrahend: int, minuend: int):
@@ -167,14 +211,19 @@ def main():
             log_request,
             locate_method,
             dispatch,
+            serialize_result,
         ],
         exception_handlers=[
             log_exception,
             serialize_rpc_error,
         ],
+        context_class=RpcContext,
     )
 
-    run_simple("localhost", 8000, WsgiGateway(gateway))
+    if args.asgi:
+        serve_asgi(gateway, "localhost", 8000)
+    else:
+        run_simple("localhost", 8000, WsgiGateway(gateway))
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import abc
+import typing as t
 from urllib.parse import urlparse
 
 import requests
@@ -7,6 +8,27 @@ from werkzeug.datastructures import Headers
 
 from .request import get_raw_base_url, get_raw_current_url, get_raw_path, restore_payload
 
+_RESPONSE_CHUNK_SIZE = 64 * 1024
+"""The maximum chunk size used to stream the response body from the upstream server."""
+
+
+def _stream_raw_response(raw: t.Any) -> t.Iterator[bytes]:
+    """
+    Streams the undecoded body of the given urllib3 response. Chunks are passed on as soon as they are available,
+    instead of waiting until ``_RESPONSE_CHUNK_SIZE`` bytes have been received, so slowly trickling responses (e.g.,
+    event streams) are not delayed.
+
+    :param raw: the urllib3 response
+    :return: an iterator over the chunks of the body
+    """
+    # chunked bodies are already streamed chunk by chunk, ``read1`` is only available in urllib3>=2
+    if raw.chunked or not hasattr(raw, "read1"):
+        yield from raw.stream(_RESPONSE_CHUNK_SIZE, decode_content=False)
+        return
+
+    while data := raw.read1(_RESPONSE_CHUNK_SIZE, decode_content=False):
+        yield data
+
 
 class HttpClient(abc.ABC):
     """
@@ -88,7 +110,13 @@ class SimpleRequestsClient(HttpClient):
 
         url = self._get_destination_url(request, server)
 
-        headers = dict(request.headers.items())
+        # copy the headers and look for an accept-encoding header in the same pass
+        headers = {}
+        has_accept_encoding = False
+        for key, value in request.headers.items():
+            headers[key] = value
+            if value and key.lower() == "accept-encoding":
+                has_accept_encoding = True
 
         # urllib3 (used by requests) will set an Accept-Encoding header ("gzip,deflate")
         # - See urllib3.util.request.ACCEPT_ENCODING
@@ -97,7 +125,7 @@ class SimpleRequestsClient(HttpClient):
         # - See https://github.com/psf/requests/issues/2234 and http.client.putrequest
         # Explicitly set `Accept-Encoding: identity` here if no `Accept-Encoding` header is set in the originating
         # request to avoid any unused manipulations by underlying libraries.
-        if not request.headers.get("accept-encoding"):
+        if not has_accept_encoding:
             headers["accept-encoding"] = "identity"
 
         response = self.session.request(
@@ -118,25 +146,29 @@ class SimpleRequestsClient(HttpClient):
             final_response = Response(
                 response=response.content,
                 status=response.status_code,
-                headers=Headers(dict(response.headers)),
+                headers=Headers(response.headers),
             )
             final_response.content_length = response.headers.get("Content-Length", 0)
             return final_response
 
-        response_headers = Headers(dict(response.headers))
+        response_headers = Headers(response.headers)
         if "chunked" in (transfer_encoding := response_headers.get("Transfer-Encoding", "")):
             response_headers.pop("Content-Length", None)
             # We should not set `Transfer-Encoding` in a Response, because it is the responsibility of the webserver
             # to do so, if there are no Content-Length. However, gzip behavior is more related to the actual content of
             # the response, so we keep that one.
-            transfer_encoding_values = [v.strip() for v in transfer_encoding.split(",")]
-            transfer_encoding_no_chunked = [
-                v for v in transfer_encoding_values if v.lower() != "chunked"
-            ]
-            response_headers.setlist("Transfer-Encoding", transfer_encoding_no_chunked)
+            if transfer_encoding.strip() == "chunked":
+                # the common case, where there's nothing else to keep
+                response_headers.pop("Transfer-Encoding", None)
+            else:
+                transfer_encoding_values = [v.strip() for v in transfer_encoding.split(",")]
+                transfer_encoding_no_chunked = [
+                    v for v in transfer_encoding_values if v.lower() != "chunked"
+                ]
+                response_headers.setlist("Transfer-Encoding", transfer_encoding_no_chunked)
 
         final_response = Response(
-            response=(chunk for chunk in response.raw.stream(1024, decode_content=False)),
+            response=_stream_raw_response(response.raw),
             status=response.status_code,
             headers=response_headers,
         )
@@ -13,6 +13,11 @@ from rolo.response import Response
 
 LOG = logging.getLogger(__name__)
 
+_JSON_PAYLOAD_TYPES = frozenset({list, dict})
+"""Payload types that ``HandlerChain.respond`` serializes as JSON."""
+_DATA_PAYLOAD_TYPES = frozenset({str, bytes, bytearray})
+"""Payload types that ``HandlerChain.respond`` sets directly as response data."""
+
 
 class RequestContext:
     """
@@ -20,23 +25,16 @@ class RequestContext:
     chain and allows handlers to communicate.
     """
 
+    __slots__ = ("request", "__dict__")
+
     request: Request
 
     def __init__(self, request: Request = None):
         self.request = request
 
-    def __setattr__(self, key, value):
-        self.__dict__[key] = value
-
-    def __getattr__(self, item):
-        try:
-            return self.__dict__[item]
-        except KeyError:
-            pass
-        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{item}")
-
     def get(self, key: str) -> t.Optional[t.Any]:
-        return self.__dict__.get(key)
+        # use getattr to also find attributes that subclasses store in ``__slots__``
+        return getattr(self, key, None)
 
 
 RC = t.TypeVar("RC", bound=RequestContext)
@@ -83,10 +81,22 @@ def call_safe(
     try:
         return func(*args, **kwargs)
     except Exception as e:
-        if LOG.isEnabledFor(logging.DEBUG):
-            LOG.exception(exception_message)
-        else:
-            LOG.warning("%s: %s", exception_message, e)
+        _log_handler_exception(exception_message, e)
+
+
+def _log_handler_exception(message: str, exception: Exception):
+    """
+    Logs an exception raised by a handler. If logging.DEBUG is set for the logger, then the traceback is logged,
+    otherwise just a warning with the exception message. The logging module caches ``isEnabledFor`` per level, so
+    this is cheap to call.
+
+    :param message: the message to log
+    :param exception: the exception that was raised
+    """
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.exception(message, exc_info=exception)
+    else:
+        LOG.warning("%s: %s", message, exception)
 
 
 class HandlerChain(t.Generic[RC]):
@@ -109,6 +119,21 @@ class HandlerChain(t.Generic[RC]):
     chain.
     """
 
+    # the per-request state is stored in slots, the instance dict is only created if other attributes are set
+    __slots__ = (
+        "request_handlers",
+        "response_handlers",
+        "finalizers",
+        "exception_handlers",
+        "stopped",
+        "terminated",
+        "finalized",
+        "error",
+        "response",
+        "context",
+        "__dict__",
+    )
+
     # handlers
     request_handlers: list[Handler]
     response_handlers: list[Handler]
@@ -125,6 +150,7 @@ class HandlerChain(t.Generic[RC]):
     # internal state
     stopped: bool
     terminated: bool
+    finalized: bool
     error: t.Optional[Exception]
     response: t.Optional[Response]
     context: t.Optional[RequestContext]
@@ -163,7 +189,7 @@ class HandlerChain(t.Generic[RC]):
         try:
             for handler in self.request_handlers:
                 try:
-                    handler(self, self.context, response)
+                    handler(self, context, response)
                 except Exception as e:
                     # prepare the continuation behavior, but exception handlers could overwrite it
                     if self.raise_on_error:
@@ -203,12 +229,18 @@ class HandlerChain(t.Generic[RC]):
         :param headers: additional headers
         """
         self.response.status_code = status_code
-        if isinstance(payload, (list, dict)):
+        # look up the exact payload type first, and only fall back to isinstance checks for subclasses
+        payload_type = type(payload)
+        if payload_type in _JSON_PAYLOAD_TYPES:
             self.response.set_json(payload)
-        elif isinstance(payload, (str, bytes, bytearray)):
+        elif payload_type in _DATA_PAYLOAD_TYPES:
             self.response.data = payload
         elif payload is None and not self.response.response:
             self.response.response = []
+        elif isinstance(payload, (list, dict)):
+            self.response.set_json(payload)
+        elif isinstance(payload, (str, bytes, bytearray)):
+            self.response.data = payload
         else:
             self.response.response = payload
 
@@ -237,41 +269,41 @@ class HandlerChain(t.Generic[RC]):
         self.error = error
 
     def _call_response_handlers(self, response):
+        if not self.response_handlers:
+            return
+
+        context = self.context
         for handler in self.response_handlers:
             if self.terminated:
                 return
 
             try:
-                handler(self, self.context, response)
+                handler(self, context, response)
             except Exception as e:
-                msg = "exception while running response handler"
-                if LOG.isEnabledFor(logging.DEBUG):
-                    LOG.exception(msg)
-                else:
-                    LOG.warning(msg + ": %s", e)
+                _log_handler_exception("exception while running response handler", e)
 
     def _call_finalizers(self, response):
+        if not self.finalizers:
+            return
+
+        context = self.context
         for handler in self.finalizers:
             try:
-                handler(self, self.context, response)
+                handler(self, context, response)
             except Exception as e:
-                msg = "exception while running request finalizer"
-                if LOG.isEnabledFor(logging.DEBUG):
-                    LOG.exception(msg)
-                else:
-                    LOG.warning(msg + ": %s", e)
+                _log_handler_exception("exception while running request finalizer", e)
 
     def _call_exception_handlers(self, e, response):
+        if not self.exception_handlers:
+            return
+
+        context = self.context
         for exception_handler in self.exception_handlers:
             try:
-                exception_handler(self, e, self.context, response)
+                exception_handler(self, e, context, response)
             except Exception as nested:
                 # make sure we run all exception handlers
-                msg = "exception while running exception handler"
-                if LOG.isEnabledFor(logging.DEBUG):
-                    LOG.exception(msg)
-                else:
-                    LOG.warning(msg + ": %s", nested)
+                _log_handler_exception("exception while running exception handler", nested)
 
 
 class CompositeHandler:
@@ -281,8 +313,9 @@ class CompositeHandler:
     """
 
     handlers: list[Handler]
+    return_on_stop: bool
 
-    def __init__(self, return_on_stop=True) -> None:
+    def __init__(self, return_on_stop: bool = True) -> None:
         """
         Creates a new composite handler with an empty handler list.
 
@@ -352,11 +385,10 @@ class CompositeExceptionHandler:
         self, chain: HandlerChain, exception: Exception, context: RequestContext, response: Response
     ):
         for handler in self.handlers:
-            call_safe(
-                handler,
-                args=(chain, exception, context, response),
-                exception_message="exception while running exception handler",
-            )
+            try:
+                handler(chain, exception, context, response)
+            except Exception as e:
+                _log_handler_exception("exception while running exception handler", e)
 
 
 class CompositeResponseHandler(CompositeHandler):
@@ -372,13 +404,12 @@ class CompositeResponseHandler(CompositeHandler):
 
 class CompositeFinalizer(CompositeResponseHandler):
     """
-    A CompositeHandler that uses ``call_safe`` to invoke handlers, so every handler is always executed.
+    A CompositeHandler that invokes handlers safely (like ``call_safe``), so every handler is always executed.
     """
 
     def __call__(self, chain: HandlerChain, context: RequestContext, response: Response):
         for handler in self.handlers:
-            call_safe(
-                handler,
-                args=(chain, context, response),
-                exception_message="Error while running request finalizer",
-            )
+            try:
+                handler(chain, context, response)
+            except Exception as e:
+                _log_handler_exception("Error while running request finalizer", e)
@@ -56,7 +56,9 @@ class EmptyResponseHandler:
     def populate_default_response(self, response: Response):
         response.status_code = self.status_code
         response.data = self.body
-        response.headers.update(self.headers)
+        if self.headers:
+            # ``update`` (rather than ``extend``) replaces headers that are already set on the response
+            response.headers.update(self.headers)
 
 
 class WerkzeugExceptionHandler:
@@ -69,12 +71,15 @@ class WerkzeugExceptionHandler:
         if not isinstance(exception, HTTPException):
             return
 
-        headers = Headers(exception.get_headers())  # FIXME
-        headers.pop()
+        # keep the headers of the exception (e.g., ``Allow`` of a ``MethodNotAllowed``), including the
+        # ``text/html`` content type of the html body
+        headers = Headers(exception.get_headers())
 
         if self.format == "html":
             chain.respond(status_code=exception.code, headers=headers, payload=exception.get_body())
         elif self.format == "json":
+            # the json payload sets its own content type
+            headers.remove("Content-Type")
             chain.respond(
                 status_code=exception.code,
                 headers=headers,
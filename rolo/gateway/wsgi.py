@@ -1,6 +1,6 @@
 import typing as t
 
-from werkzeug.datastructures import Headers, MultiDict
+from werkzeug.datastructures import Headers
 from werkzeug.wrappers import Request
 
 from rolo.response import Response
@@ -29,13 +29,15 @@ class WsgiGateway:
     def __call__(
         self, environ: "WSGIEnvironment", start_response: "StartResponse"
     ) -> t.Iterable[bytes]:
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(
+                "%s %s%s",
+                environ["REQUEST_METHOD"],
+                environ.get("HTTP_HOST"),
+                environ.get("RAW_URI"),
+            )
+
         # create request from environment
-        LOG.debug(
-            "%s %s%s",
-            environ["REQUEST_METHOD"],
-            environ.get("HTTP_HOST"),
-            environ.get("RAW_URI"),
-        )
         request = Request(environ)
 
         raw_headers = environ.get("rolo.headers") or environ.get("asgi.headers")
@@ -44,7 +46,7 @@ class WsgiGateway:
             # see https://github.com/pallets/werkzeug/issues/940
 
             request.headers = Headers(
-                MultiDict([(k.decode("latin-1"), v.decode("latin-1")) for (k, v) in raw_headers])
+                [(k.decode("latin-1"), v.decode("latin-1")) for (k, v) in raw_headers]
             )
         else:
             # by default, werkzeug requests from environ are immutable
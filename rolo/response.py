@@ -1,21 +1,39 @@
+import functools
 import json
 import mimetypes
 import typing as t
-from importlib import resources
 
 from werkzeug.exceptions import NotFound
 from werkzeug.wrappers import Response as WerkzeugResponse
 
+try:
+    import orjson
+
+    # pass types the stdlib json module cannot serialize (or serializes differently) through to the fallback
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+except ImportError:
+    orjson = None
+
 if t.TYPE_CHECKING:
+    from importlib.abc import Traversable
     from types import ModuleType
 
 
+_STREAM_CHUNK_SIZE = 256 * 1024
+"""The default chunk size used to stream resources, in the range of common socket send buffer sizes."""
+
+
 class _StreamIterableWrapper(t.Iterable[bytes]):
     """
-    This can wrap an IO[bytes] stream to return an Iterable with a default chunk size of 65536 bytes
+    This can wrap an IO[bytes] stream to return an Iterable with a default chunk size of ``_STREAM_CHUNK_SIZE``
+    bytes
     """
 
-    def __init__(self, stream: t.IO[bytes], chunk_size: int = 65536):
+    def __init__(self, stream: t.IO[bytes], chunk_size: int = _STREAM_CHUNK_SIZE):
         self.stream = stream
         self._chunk_size = chunk_size
 
@@ -24,19 +42,58 @@ class _StreamIterableWrapper(t.Iterable[bytes]):
         When passing a stream back to the WSGI server, it will often iterate only 1 byte at a time. Using this chunking
         mechanism allows us to bypass this issue.
         The caller needs to call `close()` to properly close the file descriptor
-        :return:
+        :return: an iterator over the chunks of the stream, which stops once the stream is exhausted
         """
-        while data := self.stream.read(self._chunk_size):
-            if not data:
-                return b""
-
-            yield data
+        # iter with a sentinel runs the read loop in C instead of a Python generator frame
+        return iter(functools.partial(self.stream.read, self._chunk_size), b"")
 
     def close(self):
         if hasattr(self.stream, "close"):
             self.stream.close()
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_resource(package: str, path: str) -> t.Tuple["Traversable", str]:
+    """
+    Resolves the given path in the given package and guesses its mimetype. The result is cached, since both the
+    resource lookup and the mimetype guess always yield the same result for the same arguments. Whether the file
+    actually exists is not cached.
+
+    :param package: the name of the package to look up the file in
+    :param path: the path/file name
+    :return: a tuple of the resource and its mimetype
+    """
+    # importlib.resources is imported lazily, since it is comparatively expensive to import and rarely needed
+    from importlib import resources
+
+    resource = resources.files(package).joinpath(path)
+    mimetype = mimetypes.guess_type(resource.name)[0] or "application/octet-stream"
+    return resource, mimetype
+
+
+def _dump_json(doc: t.Any, cls: t.Type[json.JSONEncoder] = None) -> t.Union[str, bytes]:
+    """
+    Serializes the given document into JSON. Uses ``orjson`` if it is available and no custom encoder is given, and
+    otherwise the stdlib ``json`` module. The content of the output is the same, with the exception of ``uuid.UUID``
+    and ``enum.Enum`` values, which only ``orjson`` serializes, and of ``NaN`` and ``Infinity``, which ``orjson``
+    serializes as ``null`` (the stdlib writes them as ``NaN`` and ``Infinity``, which is not valid JSON). The format
+    differs however, ``orjson`` writes compact JSON without whitespace.
+
+    :param doc: the document to serialize
+    :param cls: optional JSON encoder class, which forces the use of the stdlib ``json`` module
+    :return: the serialized document, either as bytes (orjson) or str (json)
+    """
+    if orjson is not None and cls is None:
+        try:
+            return orjson.dumps(doc, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # orjson is stricter than the stdlib (e.g., it does not allow non-str dict keys), and the types orjson
+            # passes through are left to the stdlib, which either serializes them or raises a TypeError
+            pass
+
+    return json.dumps(doc, cls=cls)
+
+
 class Response(WerkzeugResponse):
     """
     An HTTP Response object, which simply extends werkzeug's Response object with a few convenience methods.
@@ -52,18 +109,20 @@ class Response(WerkzeugResponse):
         """
         self.status_code = other.status_code
         self.response = other.response
-        self._on_close.extend(other._on_close)
+        if other._on_close:
+            self._on_close.extend(other._on_close)
         self.headers.update(other.headers)
 
     def set_json(self, doc: t.Any, cls: t.Type[json.JSONEncoder] = None):
         """
-        Serializes the given dictionary using localstack's ``CustomEncoder`` into a json response, and sets the
-        mimetype automatically to ``application/json``.
+        Serializes the given dictionary into a json response, and sets the mimetype automatically to
+        ``application/json``. If ``orjson`` is installed and no custom encoder class is passed, ``orjson`` is used
+        for serialization, otherwise the stdlib ``json`` module.
 
         :param doc: the response dictionary to be serialized as JSON
         :param cls: the JSON encoder class to use for serializing the passed document
         """
-        self.data = json.dumps(doc, cls=cls)
+        self.data = _dump_json(doc, cls)
         self.mimetype = "application/json"
 
     def set_response(self, response: t.Union[str, bytes, bytearray, t.Iterable[bytes]]):
@@ -121,10 +180,8 @@ class Response(WerkzeugResponse):
         :param path: the path/file name
         :return: a new Response object
         """
-        resource = resources.files(module).joinpath(path)
+        resource, mimetype = _resolve_resource(module.__name__, path)
         if not resource.is_file():
             raise NotFound()
-        mimetype = mimetypes.guess_type(resource.name)
-        mimetype = mimetype[0] if mimetype and mimetype[0] else "application/octet-stream"
 
         return cls(_StreamIterableWrapper(resource.open("rb")), *args, mimetype=mimetype, **kwargs)
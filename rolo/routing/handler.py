@@ -1,16 +1,10 @@
+import importlib.util
 import json
 import logging
 import typing as t
 
 from werkzeug import Response as WerkzeugResponse
 
-try:
-    import pydantic  # noqa
-
-    ENABLE_PYDANTIC = True
-except ImportError:
-    ENABLE_PYDANTIC = False
-
 from rolo.request import Request
 from rolo.response import Response
 
@@ -18,6 +12,10 @@ from .router import Dispatcher, RequestArguments
 
 LOG = logging.getLogger(__name__)
 
+# only check whether pydantic is available, it is imported lazily when creating a dispatcher, so importing rolo does
+# not pay for importing pydantic
+ENABLE_PYDANTIC = importlib.util.find_spec("pydantic") is not None
+
 ResultValue = t.Union[
     WerkzeugResponse,
     str,
@@ -84,13 +82,37 @@ class HandlerDispatcher:
         return response
 
     def populate_response(self, response: Response, value: ResultValue):
-        if isinstance(value, (str, bytes, bytearray)):
-            response.data = value
-        elif isinstance(value, (dict, list)):
-            response.data = json.dumps(value, cls=self.json_encoder)
-            response.mimetype = "application/json"
-        else:
-            raise ValueError("unhandled result type %s", type(value))
+        # look up the exact type first, which covers almost all return values, before checking for subclasses
+        setter = _result_setters.get(type(value))
+        if setter is None:
+            if isinstance(value, (str, bytes, bytearray)):
+                setter = _set_data
+            elif isinstance(value, (dict, list)):
+                setter = _set_json
+            else:
+                raise ValueError("unhandled result type %s", type(value))
+
+        setter(response, value, self.json_encoder)
+
+
+def _set_data(response: Response, value: t.Union[str, bytes, bytearray], _json_encoder):
+    response.data = value
+
+
+def _set_json(
+    response: Response, value: t.Union[dict, list], json_encoder: t.Type[json.JSONEncoder]
+):
+    response.set_json(value, cls=json_encoder)
+
+
+_result_setters = {
+    str: _set_data,
+    bytes: _set_data,
+    bytearray: _set_data,
+    dict: _set_json,
+    list: _set_json,
+}
+"""Maps the exact type of endpoint return values to the function that writes them into the response."""
 
 
 def handler_dispatcher(json_encoder: t.Type[json.JSONEncoder] = None) -> Dispatcher[Handler]:
@@ -101,8 +123,12 @@ def handler_dispatcher(json_encoder: t.Type[json.JSONEncoder] = None) -> Dispatc
     :return: a new dispatcher
     """
     if ENABLE_PYDANTIC:
-        from rolo.routing.pydantic import PydanticHandlerDispatcher
-
-        return PydanticHandlerDispatcher(json_encoder)
+        try:
+            from rolo.routing.pydantic import PydanticHandlerDispatcher
+        except ImportError:
+            # pydantic is installed, but cannot be imported (e.g., because of a broken installation)
+            LOG.debug("pydantic could not be imported, using a dispatcher without pydantic support")
+        else:
+            return PydanticHandlerDispatcher(json_encoder)
 
     return HandlerDispatcher(json_encoder)
@@ -1,5 +1,6 @@
 import inspect
 import typing as t
+import weakref
 
 import pydantic
 
@@ -9,10 +10,16 @@ from rolo.response import Response
 from .handler import Handler, HandlerDispatcher, ResultValue
 from .router import RequestArguments
 
+_MISSING = object()
+
+_model_argument_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+"""Caches the result of the annotation scan per endpoint function, since the signature never changes."""
+
 
 def _get_model_argument(endpoint: Handler) -> t.Optional[tuple[str, t.Type[pydantic.BaseModel]]]:
     """
     Inspects the endpoint function using Python reflection to find in its signature a ``pydantic.BaseModel`` attribute.
+    The result is cached per function, so the reflection only happens the first time an endpoint is invoked.
 
     :param endpoint: the endpoint to inspect
     :return: a tuple containing the name and class, or None
@@ -21,9 +28,20 @@ def _get_model_argument(endpoint: Handler) -> t.Optional[tuple[str, t.Type[pydan
         # cannot yet dispatch to other callables (e.g. an object with a `__call__` method)
         return None
 
+    # bound methods are created on every attribute access, so we cache the underlying function instead
+    fn = getattr(endpoint, "__func__", endpoint)
+
+    arg = _model_argument_cache.get(fn, _MISSING)
+    if arg is _MISSING:
+        arg = _model_argument_cache[fn] = _find_model_argument(fn)
+
+    return arg
+
+
+def _find_model_argument(fn: t.Callable) -> t.Optional[tuple[str, t.Type[pydantic.BaseModel]]]:
     # finds the first pydantic.BaseModel in the list of annotations.
     # ``def foo(request: Request, id: int, item: MyItem)`` would yield ``('my_item', MyItem)``
-    for arg_name, arg_type in endpoint.__annotations__.items():
+    for arg_name, arg_type in fn.__annotations__.items():
         if arg_name in ("self", "return"):
             continue
         if not inspect.isclass(arg_type):
@@ -77,7 +95,9 @@ class PydanticHandlerDispatcher(HandlerDispatcher):
 
         if arg:
             arg_name, model = arg
-            request_args = {**request_args, arg_name: model}
+            # copy rather than update in place, the arguments belong to the caller
+            request_args = request_args.copy()
+            request_args[arg_name] = model
 
         return super().invoke_endpoint(request, endpoint, request_args)
 
@@ -86,12 +106,9 @@ class PydanticHandlerDispatcher(HandlerDispatcher):
         if isinstance(value, pydantic.BaseModel):
             value = value.model_dump()
         elif isinstance(value, (list, tuple)):
-            converted = []
-            for element in value:
-                if isinstance(element, pydantic.BaseModel):
-                    converted.append(element.model_dump())
-                else:
-                    converted.append(element)
-            value = converted
+            value = [
+                element.model_dump() if isinstance(element, pydantic.BaseModel) else element
+                for element in value
+            ]
 
         super().populate_response(response, value)
@@ -1,5 +1,6 @@
 import functools
 import threading
+import types
 import typing as t
 from typing import overload
 
@@ -54,6 +55,11 @@ def route(
     def wrapper(fn: E):
         if hasattr(fn, "rule_attributes"):
             route_marker = fn
+        elif isinstance(fn, types.FunctionType):
+            # a copy of the function (rather than a wrapper around it) does not add a call frame to every
+            # invocation of the endpoint, but still leaves the original function untouched
+            route_marker = _copy_function(fn)
+            route_marker.rule_attributes = []
         else:
 
             @functools.wraps(fn)
@@ -69,6 +75,21 @@ def route(
     return wrapper
 
 
+def _copy_function(fn: types.FunctionType) -> types.FunctionType:
+    """
+    Creates a new function object that shares the code of the given function, and copies its attributes like
+    ``functools.wraps`` would (including setting ``__wrapped__``).
+
+    :param fn: the function to copy
+    :return: a new function
+    """
+    copy = types.FunctionType(
+        fn.__code__, fn.__globals__, fn.__name__, fn.__defaults__, fn.__closure__
+    )
+    copy.__kwdefaults__ = fn.__kwdefaults__
+    return functools.update_wrapper(copy, fn)
+
+
 def call_endpoint(
     request: Request,
     endpoint: t.Callable[[Request, RequestArguments], Response],
@@ -93,16 +114,17 @@ def _clone_map_without_rules(old: Map) -> Map:
     )
 
 
-def _clone_map_with_rules(old: Map) -> Map:
+def _clone_map_with_rules(old: Map, rules: t.Iterable[Rule] = None) -> Map:
     """
     Creates a new copy of the existing map, with fresh unbound copies of all its containing rules.
 
     :param old: the map to copy
+    :param rules: optionally the rules to copy into the new map instead of the rules of the existing map
     :return: a new instance of the map
     """
     new = _clone_map_without_rules(old)
 
-    for old_rule in old.iter_rules():
+    for old_rule in old.iter_rules() if rules is None else rules:
         new.add(old_rule.empty())
 
     return new
@@ -119,7 +141,6 @@ class Router(t.Generic[E]):
         "port": PortConverter,
     }
 
-    url_map: Map
     dispatcher: Dispatcher[E]
 
     def __init__(
@@ -132,6 +153,7 @@ class Router(t.Generic[E]):
         else:
             converters = {**self.default_converters, **converters}
 
+        self._mutex = threading.RLock()
         self.url_map = Map(
             host_matching=True,
             strict_slashes=False,
@@ -139,7 +161,44 @@ class Router(t.Generic[E]):
             redirect_defaults=False,
         )
         self.dispatcher = dispatcher or call_endpoint
-        self._mutex = threading.RLock()
+
+    @property
+    def url_map(self) -> Map:
+        """
+        The werkzeug ``Map`` used to match requests. Rules are never added to or removed from a ``Map`` that may be
+        in use, instead, changes to the rules of the router invalidate the current ``Map``, and a new one is built
+        the next time it is accessed. This way, adding many rules in a row only builds a single new ``Map``. Changes
+        made directly to the current ``Map`` (e.g., registering a converter or adding a rule with ``Map.add``) are
+        carried over when the router changes its rules.
+
+        :return: the current URL Map of the router
+        """
+        url_map = self._url_map
+        if url_map is None:
+            with self._mutex:
+                url_map = self._url_map
+                if url_map is None:
+                    url_map = self._url_map = _clone_map_with_rules(self._map_template, self._rules)
+        return url_map
+
+    @url_map.setter
+    def url_map(self, url_map: Map):
+        with self._mutex:
+            # the template holds the configuration of the map (converters, host matching, ...) without any rules
+            self._map_template = _clone_map_without_rules(url_map)
+            self._rules = list(url_map.iter_rules())
+            self._url_map = url_map
+
+    def _sync_from_url_map(self):
+        """
+        Updates the map template and the rules of the router from the current URL Map, if one has been built. The
+        current URL Map is public and may have been modified directly since it was built.
+        """
+        with self._mutex:
+            url_map = self._url_map
+            if url_map is not None:
+                self._map_template = _clone_map_without_rules(url_map)
+                self._rules = list(url_map.iter_rules())
 
     @overload
     def add(
@@ -225,22 +284,20 @@ class Router(t.Generic[E]):
         :param rule_factory: the rule to add
         """
         with self._mutex:
-            new = _clone_map_with_rules(self.url_map)
+            self._sync_from_url_map()
+            template = self._map_template
 
             # instantiate, modify, and collect rules
             rules = []
-            for rule in rule_factory.get_rules(new):
+            for rule in rule_factory.get_rules(template):
                 rules.append(rule)
 
-                if rule.host is None and new.host_matching:
+                if rule.host is None and template.host_matching:
                     # this creates a "match any" rule, and will put the value of the host
                     # into the variable "__host__"
                     rule.host = "<__host__>"
 
-            for rule in rules:
-                new.add(rule)
-
-            self.url_map = new
+            self._bind_rules(rules)
 
             return rules
 
@@ -248,15 +305,29 @@ class Router(t.Generic[E]):
         """
         Thread safe version of Werkzeug's ``Map.add``. This can be used as low-level method to pass a rule directly
         to the Werkzeug URL map without any manipulation or manual creation of the rule, which ``add`` does. Like
-        ``remove``, the method actually clones and replaces the underlying URL Map, to guarantee thread safety with
-        ``dispatch``. Adding rules is therefore a relatively expensive operation.
+        ``remove``, the method does not modify the URL Map that may currently be used by ``dispatch``, to guarantee
+        thread safety. Instead, the URL Map is replaced with a new one the next time it is accessed.
 
         :param rule: the rule to add
         """
         with self._mutex:
-            new = _clone_map_with_rules(self.url_map)
-            new.add(rule)
-            self.url_map = new
+            self._sync_from_url_map()
+            self._bind_rules(list(rule.get_rules(self._map_template)))
+
+    def _bind_rules(self, rules: list[Rule]):
+        """
+        Adds the given rules to the router and invalidates the current URL Map. The rules are bound to the map
+        template, so they are compiled (and invalid rules fail) right away, while the new URL Map is only built once
+        it is needed.
+
+        :param rules: the new rules to add
+        """
+        with self._mutex:
+            for rule in rules:
+                rule.bind(self._map_template)
+
+            self._rules.extend(rules)
+            self._url_map = None
 
     def remove(self, rules: t.Union[Rule, t.Iterable[Rule]]):
         """
@@ -290,21 +361,16 @@ class Router(t.Generic[E]):
         :param rules: the list of Rule objects to remove that were previously returned by ``add``.
         """
         with self._mutex:
-            old = self.url_map
+            self._sync_from_url_map()
+            old = self._rules
             for r in rules:
-                if r not in old._rules:
+                if r not in old:
                     raise KeyError("no such rule")
 
             # collect all old rules that are not in the set of rules to remove
-            new = _clone_map_without_rules(old)
-
-            for old_rule in old.iter_rules():
-                if old_rule in rules:
-                    # this works even with copied rules because of the __eq__ implementation of Rule
-                    continue
-
-                new.add(old_rule.empty())
-            self.url_map = new
+            # this works even with copied rules because of the __eq__ implementation of Rule
+            self._rules = [old_rule for old_rule in old if old_rule not in rules]
+            self._url_map = None
 
     def dispatch(self, request: Request) -> Response:
         """
@@ -315,7 +381,10 @@ class Router(t.Generic[E]):
         :param request: the HTTP request
         :return: the HTTP response
         """
-        matcher = self.url_map.bind(server_name=request.host)
+        url_map = self._url_map
+        if url_map is None:
+            url_map = self.url_map
+        matcher = url_map.bind(server_name=request.host)
         # Match on the _raw_ path to ensure that converters (like "path") can extract the raw path.
         # f.e. router.add(/<path:path>, ProxyHandler(...))
         # If we would use the - already url-decoded - request.path here, a handler would not be able to access
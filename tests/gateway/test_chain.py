@@ -1,5 +1,6 @@
 from unittest import mock
 
+import pytest
 from werkzeug.datastructures import Headers
 
 from rolo.gateway import CompositeFinalizer, CompositeHandler, HandlerChain, RequestContext
@@ -56,6 +57,31 @@ def test_finalizer_handler_exception():
     assert chain.error is None
 
 
+def test_raise_on_error():
+    def _raise(*args, **kwargs):
+        raise ValueError("oh noes")
+
+    exception = mock.MagicMock()
+    response = mock.MagicMock()
+    finalizer = mock.MagicMock()
+
+    chain = HandlerChain(
+        request_handlers=[_raise],
+        response_handlers=[response],
+        exception_handlers=[exception],
+        finalizers=[finalizer],
+    )
+    chain.raise_on_error = True
+
+    with pytest.raises(ValueError):
+        chain.handle(RequestContext(), Response())
+
+    exception.assert_called_once()
+    response.assert_not_called()
+    finalizer.assert_called_once()
+    assert isinstance(chain.error, ValueError)
+
+
 def test_composite_finalizer_handler_exception():
     def _raise(*args, **kwargs):
         raise ValueError("oh noes")
@@ -112,6 +138,20 @@ def test_respond_with_string_response():
     assert chain.response.mimetype == "text/plain"
 
 
+def test_respond_with_subclass_payload():
+    class _Dict(dict):
+        pass
+
+    def handle(chain_: HandlerChain, _context, _response):
+        chain_.respond(200, _Dict(foo="bar"))
+
+    chain = HandlerChain(request_handlers=[handle])
+    chain.handle(RequestContext(), Response())
+
+    assert chain.response.json == {"foo": "bar"}
+    assert chain.response.mimetype == "application/json"
+
+
 class TestCompositeHandler:
     def test_composite_handler_stops_handler_chain(self):
         def inner1(_chain: HandlerChain, request: RequestContext, response: Response):
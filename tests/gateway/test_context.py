@@ -30,3 +30,16 @@ def test_set_and_get_data():
     assert context.get("some_data") == "foo"
     context.some_data = "bar"
     assert context.get("some_data") == "bar"
+
+
+def test_get_slotted_data_of_subclass():
+    class MyContext(RequestContext):
+        __slots__ = ("some_data",)
+
+    context = MyContext()
+    assert context.get("some_data") is None
+
+    context.some_data = "foo"
+    assert context.some_data == "foo"
+    assert context.get("some_data") == "foo"
+    assert "some_data" not in context.__dict__
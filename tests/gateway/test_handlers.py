@@ -1,7 +1,8 @@
 import pytest
 import requests
 from werkzeug import Request
-from werkzeug.exceptions import BadRequest
+from werkzeug.datastructures import Headers
+from werkzeug.exceptions import BadRequest, MethodNotAllowed
 
 from rolo import Response, Router
 from rolo.gateway import Gateway, HandlerChain, RequestContext
@@ -46,6 +47,32 @@ class TestWerkzeugExceptionHandler:
         assert resp.status_code == 400
         assert resp.json() == {"code": 400, "description": "oh noes"}
 
+    @pytest.mark.parametrize("output_format", ["json", "html"])
+    def test_keeps_exception_headers(self, serve_gateway, output_format):
+        def handler(chain: HandlerChain, context: RequestContext, response: Response):
+            raise MethodNotAllowed(valid_methods=["GET", "HEAD"])
+
+        server = serve_gateway(
+            Gateway(
+                request_handlers=[
+                    handler,
+                ],
+                exception_handlers=[
+                    WerkzeugExceptionHandler(output_format),
+                ],
+            )
+        )
+
+        resp = requests.post(server.url)
+        assert resp.status_code == 405
+        assert resp.headers["Allow"] == "GET, HEAD"
+        if output_format == "json":
+            assert resp.headers["Content-Type"] == "application/json"
+            assert resp.json() == {"code": 405, "description": MethodNotAllowed.description}
+        else:
+            assert resp.headers["Content-Type"] == "text/html; charset=utf-8"
+            assert "405 Method Not Allowed" in resp.text
+
 
 @pytest.mark.parametrize("serve_gateway", ["wsgi", "asgi", "twisted"], indirect=True)
 class TestRouterHandler:
@@ -94,3 +121,36 @@ class TestEmptyResponseHandler:
         response = requests.post(server.url)
         assert response.text == "teapot?"
         assert response.status_code == 412
+
+    def test_empty_response_handler_headers(self, serve_gateway):
+        def _handler(chain, context, response):
+            response.status_code = 0
+            response.headers["X-Foo"] = "baz"
+
+        server = serve_gateway(
+            Gateway(
+                request_handlers=[_handler],
+                response_handlers=[
+                    EmptyResponseHandler(status_code=404, headers=Headers({"X-Foo": "bar"}))
+                ],
+            )
+        )
+
+        response = requests.get(server.url)
+        assert response.status_code == 404
+        assert response.headers["X-Foo"] == "bar"
+
+        def _empty_handler(chain, context, response):
+            response.status_code = 0
+
+        server = serve_gateway(
+            Gateway(
+                request_handlers=[_empty_handler],
+                response_handlers=[EmptyResponseHandler()],
+            )
+        )
+
+        response = requests.get(server.url)
+        assert response.status_code == 404
+        assert response.text == ""
+        assert "X-Foo" not in response.headers
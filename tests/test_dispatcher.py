@@ -80,3 +80,28 @@ class TestHandlerDispatcher:
 
         router.add("/", handler)
         assert router.dispatch(Request("GET", "/")).status_code == 200
+
+    def test_handler_dispatcher_with_subclass_return(self):
+        router = Router(dispatcher=handler_dispatcher())
+
+        class MyDict(dict):
+            pass
+
+        class MyStr(str):
+            pass
+
+        router.add("/dict", lambda _request: MyDict(hello="there"))
+        router.add("/str", lambda _request: MyStr("hello"))
+
+        response = router.dispatch(Request("GET", "/dict"))
+        assert response.mimetype == "application/json"
+        assert response.json == {"hello": "there"}
+        assert router.dispatch(Request("GET", "/str")).data == b"hello"
+
+    def test_handler_dispatcher_with_invalid_return(self):
+        router = Router(dispatcher=handler_dispatcher())
+
+        router.add("/", lambda _request: 42)
+
+        with pytest.raises(ValueError):
+            router.dispatch(Request("GET", "/"))
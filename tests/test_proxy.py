@@ -240,6 +240,26 @@ class TestProxy:
             assert response.json["headers"]["X-Forwarded-For"] == "127.0.0.10"
             assert response.json["headers"]["Host"] == "127.0.0.1:80"
 
+    @pytest.mark.parametrize(
+        "request_headers,expected",
+        [
+            ({}, "identity"),
+            ({"Accept-Encoding": "gzip"}, "gzip"),
+            ({"accept-encoding": "br"}, "br"),
+        ],
+    )
+    def test_proxy_accept_encoding(self, httpserver: HTTPServer, request_headers, expected):
+        httpserver.expect_request("/").respond_with_handler(echo_request_metadata_handler)
+
+        proxy = Proxy(httpserver.url_for("/").lstrip("/"))
+
+        request = Request(
+            path="/", method="GET", headers={"Host": "127.0.0.1:80", **request_headers}
+        )
+        response = proxy.request(request)
+
+        assert response.json["headers"]["Accept-Encoding"] == expected
+
     @pytest.mark.parametrize("chunked", [True, False])
     def test_proxy_for_transfer_encoding_chunked(
         self,
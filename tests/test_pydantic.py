@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from typing import TypedDict
 
 import pydantic
@@ -7,6 +9,7 @@ from werkzeug.exceptions import BadRequest
 from rolo import Request, Router, resource
 from rolo.routing import handler as routing_handler
 from rolo.routing import handler_dispatcher
+from rolo.routing import pydantic as routing_pydantic
 
 pydantic_version = pydantic.version.version_short()
 
@@ -144,6 +147,20 @@ class TestPydanticHandlerDispatcher:
         with pytest.raises(BadRequest):
             assert router.dispatch(request)
 
+    def test_request_arg_with_large_int(self):
+        class MyCounter(pydantic.BaseModel):
+            count: int
+
+        router = Router(dispatcher=handler_dispatcher())
+
+        def handler(_request: Request, counter: MyCounter) -> dict:
+            return {"count": str(counter.count)}
+
+        router.add("/counters", handler)
+
+        request = Request("POST", "/counters", body=b'{"count": 123456789012345678901234567890}')
+        assert router.dispatch(request).get_json() == {"count": "123456789012345678901234567890"}
+
     def test_missing_annotation(self):
         router = Router(dispatcher=handler_dispatcher())
 
@@ -157,6 +174,18 @@ class TestPydanticHandlerDispatcher:
         request = Request("POST", "/items", body=b'{"name":"rolo","price":420.69}')
         assert router.dispatch(request).get_json(force=True) == {"item": None}
 
+    def test_pydantic_is_imported_lazily(self):
+        code = "import sys, rolo; print('pydantic' in sys.modules)"
+        output = subprocess.check_output([sys.executable, "-c", code])
+        assert output.strip() == b"False"
+
+    def test_with_pydantic_not_importable(self, monkeypatch):
+        # simulates a pydantic installation that is found but fails to import
+        monkeypatch.setitem(sys.modules, "rolo.routing.pydantic", None)
+
+        dispatcher = handler_dispatcher()
+        assert type(dispatcher) is routing_handler.HandlerDispatcher
+
     def test_with_pydantic_disabled(self, monkeypatch):
         monkeypatch.setattr(routing_handler, "ENABLE_PYDANTIC", False)
         router = Router(dispatcher=handler_dispatcher())
@@ -199,6 +228,17 @@ class TestPydanticHandlerDispatcher:
             "item_id": 123,
         }
 
+    def test_model_argument_is_cached(self):
+        class MyResource:
+            def on_post(self, request: Request, item: MyItem):
+                return {"item": item.model_dump()}
+
+        obj = MyResource()
+        assert routing_pydantic._get_model_argument(obj.on_post) == ("item", MyItem)
+        # bound methods are re-created on every access, but share the cache entry of the function
+        assert MyResource.on_post in routing_pydantic._model_argument_cache
+        assert routing_pydantic._get_model_argument(obj.on_post) == ("item", MyItem)
+
     def test_with_generic_type_alias(self):
         router = Router(dispatcher=handler_dispatcher())
 
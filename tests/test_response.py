@@ -1,9 +1,14 @@
+import dataclasses
+import datetime
 import io
+import json
 
 import pytest
 from werkzeug.exceptions import NotFound
 
 from rolo import Response
+from rolo import response as response_module
+from rolo.response import _resolve_resource
 from tests import static
 
 
@@ -29,6 +34,27 @@ def test_for_resource_with_custom_response_status_and_headers():
     assert response.headers.get("X-Foo") == "Bar"
 
 
+def test_for_resource_is_streamed_in_chunks():
+    response = Response.for_resource(static, "test.txt")
+    response.response._chunk_size = 4
+
+    chunks = list(response.response)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 4 for chunk in chunks)
+    assert b"".join(chunks) == b"hello world\n"
+    response.close()
+
+
+def test_for_resource_resolves_resource_once():
+    _resolve_resource.cache_clear()
+
+    Response.for_resource(static, "test.txt").close()
+    Response.for_resource(static, "test.txt").close()
+
+    assert _resolve_resource.cache_info().misses == 1
+    assert _resolve_resource.cache_info().hits == 1
+
+
 def test_for_resource_not_found():
     with pytest.raises(NotFound):
         Response.for_resource(static, "doesntexist.txt")
@@ -39,7 +65,7 @@ def test_for_json():
         {"foo": "bar", "420": 69, "isTrue": True},
     )
     assert response.content_type == "application/json"
-    assert response.get_data() == b'{"foo": "bar", "420": 69, "isTrue": true}'
+    assert response.json == {"foo": "bar", "420": 69, "isTrue": True}
     assert response.status == "200 OK"
 
 
@@ -50,7 +76,7 @@ def test_for_json_with_custom_response_status_and_headers():
         headers={"X-Foo": "Bar"},
     )
     assert response.content_type == "application/json"
-    assert response.get_data() == b'{"foo": "bar", "420": 69, "isTrue": true}'
+    assert response.json == {"foo": "bar", "420": 69, "isTrue": True}
     assert response.status == "201 CREATED"
     assert response.headers.get("X-Foo") == "Bar"
 
@@ -82,3 +108,50 @@ def test_update_from():
     assert response.status_code == 202
     assert response.headers.get("X-Foo") == "Bar"
     assert response.content_type == "application/octet-stream"
+
+
+def test_set_json_with_non_str_keys():
+    response = Response()
+    response.set_json({1: "foo", "bar": [1, 2]})
+    assert response.content_type == "application/json"
+    assert response.json == {"1": "foo", "bar": [1, 2]}
+
+
+def test_set_json_with_custom_encoder():
+    class CustomEncoder(json.JSONEncoder):
+        def default(self, o):
+            if isinstance(o, set):
+                return sorted(o)
+            return super().default(o)
+
+    response = Response()
+    response.set_json({"foo": {3, 1, 2}}, cls=CustomEncoder)
+    assert response.json == {"foo": [1, 2, 3]}
+
+
+def test_set_json_with_non_finite_floats():
+    pytest.importorskip("orjson")
+
+    response = Response()
+    response.set_json({"nan": float("nan"), "values": [None, float("inf")]})
+    assert response.get_data() == b'{"nan":null,"values":[null,null]}'
+
+
+def test_set_json_without_orjson(monkeypatch):
+    monkeypatch.setattr(response_module, "orjson", None)
+
+    response = Response()
+    response.set_json({"foo": [1, None, float("nan")], 1: "bar"})
+    assert response.content_type == "application/json"
+    assert response.get_data() == b'{"foo": [1, null, NaN], "1": "bar"}'
+
+
+@pytest.mark.parametrize(
+    "value",
+    [datetime.datetime(2024, 1, 1), dataclasses.make_dataclass("Item", ["name"])("rolo")],
+    ids=["datetime", "dataclass"],
+)
+def test_set_json_with_unsupported_type(value):
+    response = Response()
+    with pytest.raises(TypeError):
+        response.set_json({"value": value})
@@ -1,3 +1,4 @@
+import functools
 import threading
 from typing import Callable, List, Tuple
 
@@ -5,7 +6,7 @@ import pytest
 import requests
 import werkzeug
 from werkzeug.exceptions import MethodNotAllowed, NotFound
-from werkzeug.routing import RequestRedirect, Submount
+from werkzeug.routing import BaseConverter, RequestRedirect, Rule, Submount
 
 from rolo import Request, Response, Router
 from rolo.routing import RequestArguments, RuleAdapter, WithHost, route
@@ -357,6 +358,51 @@ class TestRouter:
             router.remove(rule)
         e.match("no such rule")
 
+    def test_url_map_is_rebuilt_lazily(self):
+        router = Router(dispatcher=noop)
+        url_map = router.url_map
+
+        rules = [router.add(f"/route-{i}", "endpoint") for i in range(5)]
+        assert router.url_map is not url_map
+
+        url_map = router.url_map
+        assert router.url_map is url_map
+        assert len(list(url_map.iter_rules())) == 5
+
+        router.remove(rules[0])
+        assert router.url_map is not url_map
+        assert len(list(router.url_map.iter_rules())) == 4
+
+    def test_add_invalid_rule_fails_immediately(self):
+        router = Router(dispatcher=noop)
+        router.add("/", "index")
+
+        with pytest.raises(LookupError):
+            router.add("/<doesnotexist:foo>", "endpoint")
+
+        assert router.dispatch(Request("GET", "/")).status_code == 200
+        assert len(list(router.url_map.iter_rules())) == 1
+
+    def test_add_rule_with_converter_added_to_url_map(self):
+        class UpperConverter(BaseConverter):
+            def to_python(self, value):
+                return value.upper()
+
+        router = Router()
+        router.url_map.converters["upper"] = UpperConverter
+        router.add("/<upper:name>", echo_params_json)
+
+        assert router.dispatch(Request("GET", "/foo")).json == {"name": "FOO"}
+
+    def test_add_rule_keeps_rules_added_to_url_map(self):
+        router = Router()
+        router.url_map.add(Rule("/direct", host="<__host__>", endpoint=echo_params_json))
+        router.add("/added", echo_params_json)
+
+        assert router.dispatch(Request("GET", "/direct")).status_code == 200
+        assert router.dispatch(Request("GET", "/added")).status_code == 200
+        assert len(list(router.url_map.iter_rules())) == 2
+
     def test_router_route_decorator(self):
         router = Router()
 
@@ -401,6 +447,100 @@ class TestRouter:
         assert router.dispatch(Request("GET", "/users")).data == b"user"
         assert router.dispatch(Request("GET", "/users/123")).data == b"123"
 
+    def test_add_route_endpoint_with_objects_of_same_class(self):
+        class MyApi:
+            def __init__(self, name: str):
+                self.name = name
+
+                @route(f"/{name}/instance")
+                def instance_endpoint(_: Request, args):
+                    return Response(f"{name}-instance")
+
+                self.instance_endpoint = instance_endpoint
+
+            @route("/<name>/method")
+            def method_endpoint(self, _: Request, args):
+                return Response(f"{self.name}-method")
+
+            @property
+            def property_endpoint(self):
+                @route(f"/{self.name}/property")
+                def _endpoint(_: Request, args):
+                    return Response(f"{self.name}-property")
+
+                return _endpoint
+
+        router = Router()
+        assert len(router.add(MyApi("foo"))) == 3
+        assert len(router.add(MyApi("bar"))) == 3
+
+        assert router.dispatch(Request("GET", "/foo/instance")).data == b"foo-instance"
+        assert router.dispatch(Request("GET", "/bar/instance")).data == b"bar-instance"
+        assert router.dispatch(Request("GET", "/bar/property")).data == b"bar-property"
+
+    def test_add_route_endpoint_with_object_slots(self):
+        @route("/slotted")
+        def endpoint(_: Request, args):
+            return Response(b"slotted")
+
+        class MyApi:
+            __slots__ = ("endpoint",)
+
+            def __init__(self):
+                self.endpoint = endpoint
+
+        router = Router()
+        assert len(router.add(MyApi())) == 1
+        assert router.dispatch(Request("GET", "/slotted")).data == b"slotted"
+
+    def test_add_route_endpoint_with_object_cached_property(self):
+        class MyApi:
+            @functools.cached_property
+            def endpoint(self):
+                @route("/cached")
+                def _endpoint(_: Request, args):
+                    return Response(b"cached")
+
+                return _endpoint
+
+        router = Router()
+        assert len(router.add(MyApi())) == 1
+        assert router.dispatch(Request("GET", "/cached")).data == b"cached"
+
+    def test_add_route_endpoint_with_object_dir(self):
+        @route("/dynamic")
+        def endpoint(_: Request, args):
+            return Response(b"dynamic")
+
+        class MyApi:
+            def __dir__(self):
+                return ["endpoint"]
+
+            def __getattr__(self, item):
+                if item == "endpoint":
+                    return endpoint
+                raise AttributeError(item)
+
+        router = Router()
+        assert len(router.add(MyApi())) == 1
+        assert router.dispatch(Request("GET", "/dynamic")).data == b"dynamic"
+
+    def test_add_route_endpoint_with_object_after_class_changed(self):
+        class MyApi:
+            pass
+
+        router = Router()
+        assert router.add(MyApi()) == []
+
+        @route("/late")
+        def late(self, _: Request, args):
+            return Response(b"late")
+
+        MyApi.late = late
+
+        assert len(router.add(MyApi())) == 1
+        assert router.dispatch(Request("GET", "/late")).data == b"late"
+
     def test_add_route_endpoint_with_object_per_method(self):
         # tests whether there can be multiple rules with different methods to the same URL
         class MyApi:
@@ -432,6 +572,29 @@ class TestRouter:
         with pytest.raises(MethodNotAllowed):
             router.dispatch(Request("DELETE", "/my_api"))
 
+    def test_route_decorator_copies_function(self):
+        def endpoint(_: Request, args) -> Response:
+            """my endpoint"""
+            return Response(b"ok")
+
+        route_a = route("/a")(endpoint)
+        route_b = route("/b")(endpoint)
+
+        # the original function is left untouched, and each decoration creates an independent endpoint
+        assert not hasattr(endpoint, "rule_attributes")
+        assert [attr.path for attr in route_a.rule_attributes] == ["/a"]
+        assert [attr.path for attr in route_b.rule_attributes] == ["/b"]
+
+        # the endpoint is not wrapped, but runs the code of the original function directly
+        assert route_a.__code__ is endpoint.__code__
+        assert route_a.__wrapped__ is endpoint
+        assert route_a.__name__ == "endpoint"
+        assert route_a.__doc__ == "my endpoint"
+
+        router = Router()
+        router.add(route_a)
+        assert router.dispatch(Request("GET", "/a")).data == b"ok"
+
     def test_head_requests_are_routed_to_get_handlers(self):
         @route("/my_api", methods=["GET"])
         def do_get(request: Request, _args):